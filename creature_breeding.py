@@ -4,8 +4,37 @@ Creature Breeding System
 A simple system for creating and breeding creatures with inheritable traits.
 """
 
+import operator
 import random
-from typing import Optional
+import sys
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+
+# Color blending rules, keyed by the unordered pair of parent colors
+_COLOR_BLENDS = {
+    frozenset(('Red', 'Blue')): 'Purple',
+    frozenset(('Red', 'Yellow')): 'Orange',
+    frozenset(('Blue', 'Yellow')): 'Green',
+}
+
+# Suffix for offspring of parents whose names are too short to blend
+_SHORT_NAME_SUFFIX = "Jr"
+
+# Indentation strings for family tree levels, grown on demand by _prefix()
+_PREFIX_CACHE = [""]
+
+class Stats(NamedTuple):
+    """Snapshot of a creature's stats, as returned by Creature.get_stats()."""
+    name: str
+    species: str
+    color: str
+    size: int
+    strength: int
+    intelligence: int
+    generation: int
 
 
 class Creature:
@@ -23,49 +52,95 @@ class Creature:
         parents (tuple): Reference to parent creatures (if any)
     """
     
+    __slots__ = ('name', 'species', 'color', 'size', 'strength', 'intelligence',
+                 'generation', 'parents')
+    
     def __init__(self, name: str, species: str, color: str, 
                  size: int, strength: int, intelligence: int,
                  generation: int = 1, parents: Optional[tuple] = None):
         self.name = name
-        self.species = species
-        self.color = color
-        self.size = max(1, min(10, size))  # Clamp between 1-10
-        self.strength = max(1, min(10, strength))
-        self.intelligence = max(1, min(10, intelligence))
+        # Interned so equal species/colors share one object and compare by
+        # identity; sys.intern only accepts exact str instances
+        self.species = sys.intern(species) if type(species) is str else species
+        self.color = sys.intern(color) if type(color) is str else color
+        # Clamp between 1-10
+        self.size = 1 if size < 1 else (10 if size > 10 else size)
+        self.strength = 1 if strength < 1 else (10 if strength > 10 else strength)
+        self.intelligence = 1 if intelligence < 1 else (10 if intelligence > 10 else intelligence)
         self.generation = generation
         self.parents = parents
     
     def __str__(self):
-        parent_info = ""
+        lines = [
+            f"Creature: {self.name}",
+            f"  Species: {self.species}",
+            f"  Color: {self.color}",
+            f"  Size: {self.size}/10",
+            f"  Strength: {self.strength}/10",
+            f"  Intelligence: {self.intelligence}/10",
+            f"  Generation: {self.generation}",
+        ]
         if self.parents:
-            parent_info = f"\n  Parents: {self.parents[0].name} & {self.parents[1].name}"
-        
-        return (f"Creature: {self.name}\n"
-                f"  Species: {self.species}\n"
-                f"  Color: {self.color}\n"
-                f"  Size: {self.size}/10\n"
-                f"  Strength: {self.strength}/10\n"
-                f"  Intelligence: {self.intelligence}/10\n"
-                f"  Generation: {self.generation}"
-                f"{parent_info}")
+            lines.append(f"  Parents: {self.parents[0].name} & {self.parents[1].name}")
+        return "\n".join(lines)
     
     def __repr__(self):
         return f"Creature(name='{self.name}', species='{self.species}', generation={self.generation})"
     
-    def get_stats(self):
-        """Returns a dictionary of the creature's stats."""
-        return {
-            'name': self.name,
-            'species': self.species,
-            'color': self.color,
-            'size': self.size,
-            'strength': self.strength,
-            'intelligence': self.intelligence,
-            'generation': self.generation
-        }
+    def get_stats(self) -> 'Stats':
+        """Returns a Stats tuple of the creature's stats."""
+        return Stats(self.name, self.species, self.color, self.size,
+                     self.strength, self.intelligence, self.generation)
+
+
+class BreedingRNG:
+    """
+    A seeded buffer of random draws for reproducible breeding.
+    
+    Holds DRAWS_PER_OFFSPRING values in [0, 1) for each of n offspring, drawn
+    from a private random.Random. Each breeding path is reproducible on its
+    own: breeding the same parents with buffers built from the same seed
+    gives the same offspring every run. breed_creatures() and
+    Population.breed_batch() consume the draws in a different order and
+    form, so the two paths do not give the same offspring as each other.
+    
+    This does not make breeding faster. The draws cost as much as calling
+    the random module directly.
+    
+    Attributes:
+        n (int): Number of offspring the buffer can serve
+        draws (array): Double-precision draws, DRAWS_PER_OFFSPRING per offspring
+        i (int): Number of offspring whose draws have been reserved
+    """
+    
+    # Three trait mutations and two color rolls
+    DRAWS_PER_OFFSPRING = 5
+    
+    def __init__(self, n: int, seed: Optional[int] = None):
+        rng = random.Random(seed)
+        self.n = n
+        self.draws = array('d', [rng.random() for _ in range(n * self.DRAWS_PER_OFFSPRING)])
+        self.i = 0
+    
+    def take(self, count: int = 1) -> Callable[[], float]:
+        """
+        Reserves the draws for the next count offspring.
+        
+        Returns:
+            A function returning the reserved draws one at a time, in order
+        
+        Raises:
+            IndexError: If fewer than count offspring's draws remain unused
+        """
+        if self.i + count > self.n:
+            raise IndexError("BreedingRNG buffer exhausted")
+        start = self.i * self.DRAWS_PER_OFFSPRING
+        self.i += count
+        return iter(self.draws[start:start + count * self.DRAWS_PER_OFFSPRING]).__next__
 
 
-def breed_creatures(parent1: Creature, parent2: Creature) -> Creature:
+def breed_creatures(parent1: Creature, parent2: Creature,
+                    rng_buf: Optional[BreedingRNG] = None) -> Creature:
     """
     Breeds two creatures to produce an offspring.
     
@@ -75,6 +150,8 @@ def breed_creatures(parent1: Creature, parent2: Creature) -> Creature:
     Args:
         parent1: First parent creature
         parent2: Second parent creature
+        rng_buf: Optional seeded draws to consume instead of calling the
+            random module
     
     Returns:
         A new Creature instance representing the offspring
@@ -85,6 +162,8 @@ def breed_creatures(parent1: Creature, parent2: Creature) -> Creature:
     if parent1.species != parent2.species:
         raise ValueError(f"Cannot breed different species: {parent1.species} and {parent2.species}")
     
+    draw = random.random if rng_buf is None else rng_buf.take()
+    
     # Generate offspring name from parent names
     offspring_name = _generate_offspring_name(parent1.name, parent2.name)
     
@@ -92,12 +171,12 @@ def breed_creatures(parent1: Creature, parent2: Creature) -> Creature:
     offspring_species = parent1.species
     
     # Inherit or blend color
-    offspring_color = _inherit_color(parent1.color, parent2.color)
+    offspring_color = _inherit_color(parent1.color, parent2.color, draw)
     
     # Inherit numeric traits with variation
-    offspring_size = _inherit_trait(parent1.size, parent2.size)
-    offspring_strength = _inherit_trait(parent1.strength, parent2.strength)
-    offspring_intelligence = _inherit_trait(parent1.intelligence, parent2.intelligence)
+    offspring_size = _inherit_trait(parent1.size, parent2.size, draw)
+    offspring_strength = _inherit_trait(parent1.strength, parent2.strength, draw)
+    offspring_intelligence = _inherit_trait(parent1.intelligence, parent2.intelligence, draw)
     
     # Determine generation
     offspring_generation = max(parent1.generation, parent2.generation) + 1
@@ -117,77 +196,311 @@ def breed_creatures(parent1: Creature, parent2: Creature) -> Creature:
     return offspring
 
 
+class Population:
+    """
+    A collection of creatures stored as parallel arrays.
+    
+    Each attribute lives in its own list or array, indexed by row, so
+    breed_batch() can process a whole batch one column at a time instead of
+    one creature at a time. Creature instances are built on demand as views
+    of a row via creature().
+    
+    Attributes:
+        names (list): Creature names, one per row
+        species (list): Creature species, one per row
+        colors (list): Creature colors, one per row
+        traits (tuple): Signed-byte arrays of sizes, strengths and
+            intelligences, one entry per row in each
+        generations (list): Generation number of each row
+        parents (list): Tuple of parent row indices, or None for founders
+    """
+    
+    def __init__(self, creatures: Sequence[Creature] = ()):
+        self.names: List[str] = []
+        self.species: List[str] = []
+        self.colors: List[str] = []
+        self.traits = (array('b'), array('b'), array('b'))
+        self.generations: List[int] = []
+        self.parents: List[Optional[tuple]] = []
+        self._views: List[Optional[Creature]] = []
+        for creature in creatures:
+            self.add(creature)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def add(self, creature: Creature) -> int:
+        """
+        Adds an existing creature as a new founder row.
+        
+        Returns:
+            The row index of the added creature
+        
+        Raises:
+            TypeError: If any of the creature's traits is not an integer
+            ValueError: If any of the creature's traits is outside 1-10
+        """
+        # Check everything before touching any column, so a bad creature
+        # never leaves the columns with different lengths
+        traits = tuple(operator.index(value) for value in
+                       (creature.size, creature.strength, creature.intelligence))
+        for value in traits:
+            if not 1 <= value <= 10:
+                raise ValueError(f"Trait value {value} of {creature.name} is outside 1-10")
+        
+        self.names.append(creature.name)
+        self.species.append(creature.species)
+        self.colors.append(creature.color)
+        for column, value in zip(self.traits, traits):
+            column.append(value)
+        self.generations.append(creature.generation)
+        self.parents.append(None)
+        self._views.append(creature)
+        return len(self.names) - 1
+    
+    def creature(self, index: int) -> Creature:
+        """
+        Returns the Creature view of a row, building it on first access.
+        
+        Views of unbuilt ancestors are built first, using an explicit stack
+        so deep pedigrees are not limited by the recursion limit.
+        """
+        views = self._views
+        sizes, strengths, intelligences = self.traits
+        stack = [index]
+        while stack:
+            row = stack[-1]
+            if views[row] is not None:
+                stack.pop()
+                continue
+            
+            parents = self.parents[row]
+            if parents is not None:
+                missing = [parent for parent in parents if views[parent] is None]
+                if missing:
+                    stack.extend(missing)
+                    continue
+                parents = (views[parents[0]], views[parents[1]])
+            
+            views[row] = Creature(
+                name=self.names[row],
+                species=self.species[row],
+                color=self.colors[row],
+                size=sizes[row],
+                strength=strengths[row],
+                intelligence=intelligences[row],
+                generation=self.generations[row],
+                parents=parents
+            )
+            stack.pop()
+        return views[index]
+    
+    def breed_batch(self, parents1_idx: Sequence[int], parents2_idx: Sequence[int],
+                    rng_buf: Optional[BreedingRNG] = None) -> List[int]:
+        """
+        Breeds many pairs of creatures in one pass.
+        
+        Pair k breeds row parents1_idx[k] with row parents2_idx[k]. Offspring
+        follow the same inheritance rules as breed_creatures() and are
+        appended to the population as new rows. Traits are looked up in
+        _trait_table() using one bulk draw of random bytes, so large batches
+        avoid per-trait arithmetic and random calls.
+        
+        Args:
+            parents1_idx: Row indices of the first parent of each pair
+            parents2_idx: Row indices of the second parent of each pair
+            rng_buf: Optional seeded draws to consume instead of calling the
+                random module
+        
+        Returns:
+            Row indices of the offspring, in pair order
+        
+        Raises:
+            ValueError: If the index sequences differ in length, any index is
+                not a row of the population, or any pair is not the same species
+        """
+        if len(parents1_idx) != len(parents2_idx):
+            raise ValueError("Parent index sequences must have the same length")
+        
+        size = len(self)
+        species = self.species
+        for i, j in zip(parents1_idx, parents2_idx):
+            if not (0 <= i < size and 0 <= j < size):
+                raise ValueError(f"Parent indices ({i}, {j}) out of range for population of {size}")
+            if species[i] != species[j]:
+                raise ValueError(f"Cannot breed different species: {species[i]} and {species[j]}")
+        
+        count = len(parents1_idx)
+        if not count:
+            return []
+        if rng_buf is None:
+            draw = random.random
+            trait_rolls = random.getrandbits(24 * count).to_bytes(3 * count, 'little')
+        else:
+            draw = rng_buf.take(count)
+            trait_rolls = bytes(int(draw() * 256) for _ in range(3 * count))
+        
+        names = self.names
+        colors = self.colors
+        generations = self.generations
+        new_names = list(map(_generate_offspring_name,
+                             map(names.__getitem__, parents1_idx),
+                             map(names.__getitem__, parents2_idx)))
+        new_species = list(map(species.__getitem__, parents1_idx))
+        new_colors = list(map(_inherit_color,
+                              map(colors.__getitem__, parents1_idx),
+                              map(colors.__getitem__, parents2_idx),
+                              repeat(draw)))
+        table = _trait_table()
+        new_traits = []
+        for k, column in enumerate(self.traits):
+            new_traits.append(array('b', [
+                table[trait1 + trait2][roll]
+                for trait1, trait2, roll in zip(map(column.__getitem__, parents1_idx),
+                                                map(column.__getitem__, parents2_idx),
+                                                trait_rolls[k * count:(k + 1) * count])
+            ]))
+        new_generations = [
+            (generation1 if generation1 > generation2 else generation2) + 1
+            for generation1, generation2 in zip(map(generations.__getitem__, parents1_idx),
+                                                map(generations.__getitem__, parents2_idx))
+        ]
+        
+        first_row = len(names)
+        names.extend(new_names)
+        species.extend(new_species)
+        colors.extend(new_colors)
+        for column, values in zip(self.traits, new_traits):
+            column.extend(values)
+        generations.extend(new_generations)
+        self.parents.extend(zip(parents1_idx, parents2_idx))
+        self._views.extend([None] * count)
+        return list(range(first_row, first_row + count))
+
+
+@lru_cache(maxsize=4096)
 def _generate_offspring_name(name1: str, name2: str) -> str:
     """
     Generates a name for offspring by combining parent names.
     
     Takes parts from each parent's name to create a new unique name.
+    Results are cached since the same pair always yields the same name.
     """
+    len1 = len(name1)
+    len2 = len(name2)
+    
     # Try to create a blend of the two names
-    if len(name1) >= 3 and len(name2) >= 3:
+    if len1 >= 3 and len2 >= 3:
         # Take first part of first name and last part of second name
-        part1 = name1[:len(name1)//2]
-        part2 = name2[len(name2)//2:]
-        return part1 + part2
+        return name1[:len1 // 2] + name2[len2 // 2:]
     else:
         # For short names, just concatenate with a suffix
-        return f"{name1}{name2}Jr"
+        return name1 + name2 + _SHORT_NAME_SUFFIX
 
 
-def _inherit_color(color1: str, color2: str) -> str:
+def _inherit_color(color1: str, color2: str,
+                   draw: Optional[Callable[[], float]] = None) -> str:
     """
     Determines offspring color from parent colors.
     
     50% chance of inheriting from either parent, with a small chance
-    of color blending for certain combinations.
-    """
-    # Color blending rules
-    color_blends = {
-        ('Red', 'Blue'): 'Purple',
-        ('Blue', 'Red'): 'Purple',
-        ('Red', 'Yellow'): 'Orange',
-        ('Yellow', 'Red'): 'Orange',
-        ('Blue', 'Yellow'): 'Green',
-        ('Yellow', 'Blue'): 'Green',
-    }
+    of color blending for certain combinations. draw, if given, supplies
+    the two random numbers in [0, 1) instead of random.random.
+    """
+    if draw is None:
+        draw = random.random
+    blend_roll = draw()
+    pick_roll = draw()
     
     # 20% chance of blending if colors can blend
-    if random.random() < 0.2 and (color1, color2) in color_blends:
-        return color_blends[(color1, color2)]
+    blend = _COLOR_BLENDS.get(frozenset((color1, color2)))
+    if blend is not None and blend_roll < 0.2:
+        return blend
     
     # Otherwise, inherit from one parent
-    return random.choice([color1, color2])
+    return color1 if pick_roll < 0.5 else color2
 
 
-def _inherit_trait(trait1: int, trait2: int) -> int:
+def _inherit_trait(trait1: int, trait2: int,
+                   draw: Optional[Callable[[], float]] = None) -> int:
     """
     Determines offspring trait value from parent traits.
     
     Takes the average of parent traits and applies a small random mutation.
+    draw, if given, supplies the random number in [0, 1) instead of
+    random.random.
     """
+    if draw is None:
+        draw = random.random
+    
     # Average of parent traits
     base_value = (trait1 + trait2) / 2
     
     # Apply small random mutation (-1 to +1)
-    mutation = random.uniform(-1, 1)
+    mutation = -1 + 2 * draw()
     
     # Calculate final value and clamp between 1-10
     final_value = round(base_value + mutation)
-    return max(1, min(10, final_value))
+    return 1 if final_value < 1 else (10 if final_value > 10 else final_value)
+
+
+@lru_cache(maxsize=None)
+def _trait_table() -> tuple:
+    """
+    Returns a lookup table equivalent to _inherit_trait(), for batch breeding.
+    
+    _inherit_trait() depends only on the sum of the parent traits and on
+    which quarter of [0, 1) its random draw falls in. table[total][roll]
+    holds its result for a parent trait sum of total and a draw in the
+    roll-th 1/256 of [0, 1), so indexing with a uniformly random byte gives
+    the same distribution as calling _inherit_trait().
+    """
+    table = [()] * 21
+    for total in range(2, 21):
+        table[total] = tuple(
+            _inherit_trait(total // 2, total - total // 2, lambda roll=roll: (roll + 0.5) / 256)
+            for roll in range(256)
+        )
+    return tuple(table)
+
+
+def _prefix(indent: int) -> str:
+    """Returns the indentation string for a tree level, cached per level."""
+    # Negative levels get no indentation, matching "  " * indent
+    indent = max(indent, 0)
+    while len(_PREFIX_CACHE) <= indent:
+        _PREFIX_CACHE.append(_PREFIX_CACHE[-1] + "  ")
+    return _PREFIX_CACHE[indent]
 
 
 def display_family_tree(creature: Creature, indent: int = 0) -> None:
     """
     Displays the family tree of a creature, showing its ancestors.
     
+    Ancestors reachable through more than one path are expanded only the
+    first time they appear; later appearances are marked "[see above]".
+    The tree is walked with an explicit stack, so deep pedigrees are not
+    limited by the recursion limit.
+    
     Args:
         creature: The creature whose family tree to display
-        indent: Current indentation level (used for recursion)
+        indent: Indentation level of the root creature
     """
-    prefix = "  " * indent
-    print(f"{prefix}{creature.name} (Gen {creature.generation}, {creature.species})")
-    
-    if creature.parents:
-        print(f"{prefix}├─ Parents:")
-        for parent in creature.parents:
-            display_family_tree(parent, indent + 1)
+    seen = set()
+    stack = [(creature, indent)]
+    while stack:
+        current, level = stack.pop()
+        prefix = _prefix(level)
+        current_id = id(current)
+        if current_id in seen:
+            print(f"{prefix}{current.name} (Gen {current.generation}, {current.species}) [see above]")
+            continue
+        seen.add(current_id)
+        
+        print(f"{prefix}{current.name} (Gen {current.generation}, {current.species})")
+        
+        if current.parents:
+            print(f"{prefix}├─ Parents:")
+            # Push in reverse so the first parent is displayed first
+            for parent in reversed(current.parents):
+                stack.append((parent, level + 1))
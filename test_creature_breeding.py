@@ -0,0 +1,334 @@
+"""
+Tests for the creature breeding system.
+
+Run with: python -m unittest test_creature_breeding
+"""
+
+import contextlib
+import io
+import unittest
+from collections import Counter
+from fractions import Fraction
+
+from creature_breeding import (
+    BreedingRNG,
+    Creature,
+    Population,
+    Stats,
+    _generate_offspring_name,
+    _inherit_color,
+    _inherit_trait,
+    _trait_table,
+    breed_creatures,
+    display_family_tree,
+)
+
+
+def fixed_draws(*values):
+    """Returns a draw function that yields the given values in order."""
+    return iter(values).__next__
+
+
+def make_dragons():
+    """Returns two founder dragons that can be bred together."""
+    return (Creature("Ember", "Dragon", "Red", 9, 8, 6),
+            Creature("Frost", "Dragon", "Blue", 8, 7, 8))
+
+
+class BreedCreaturesTest(unittest.TestCase):
+
+    def test_offspring_traits_stay_in_range(self):
+        parent1, parent2 = make_dragons()
+        for _ in range(200):
+            offspring = breed_creatures(parent1, parent2)
+            for value in (offspring.size, offspring.strength, offspring.intelligence):
+                self.assertTrue(1 <= value <= 10)
+            self.assertEqual(offspring.generation, 2)
+            self.assertEqual(offspring.parents, (parent1, parent2))
+
+    def test_different_species_raises(self):
+        dragon, _ = make_dragons()
+        unicorn = Creature("Sparkle", "Unicorn", "White", 7, 5, 9)
+        with self.assertRaises(ValueError):
+            breed_creatures(dragon, unicorn)
+
+    def test_each_breeding_returns_a_new_creature(self):
+        parent1 = Creature("Al", "Dragon", "Green", 5, 5, 5)
+        parent2 = Creature("Bo", "Dragon", "Green", 5, 5, 5)
+        offspring = [breed_creatures(parent1, parent2) for _ in range(20)]
+        self.assertEqual(len({id(creature) for creature in offspring}), 20)
+
+    def test_seeded_rng_gives_same_offspring(self):
+        parent1, parent2 = make_dragons()
+
+        def breed(seed):
+            rng_buf = BreedingRNG(10, seed=seed)
+            return [breed_creatures(parent1, parent2, rng_buf).get_stats() for _ in range(10)]
+
+        self.assertEqual(breed(42), breed(42))
+
+
+class CreatureTest(unittest.TestCase):
+
+    def test_species_and_color_are_interned(self):
+        species = "".join(["Dra", "gon"])
+        color = "".join(["R", "ed"])
+        creature = Creature("Ember", species, color, 9, 8, 6)
+        self.assertIs(creature.species, "Dragon")
+        self.assertIs(creature.color, "Red")
+
+    def test_str_subclass_species_is_accepted(self):
+        class Name(str):
+            pass
+
+        creature = Creature("Ember", Name("Dragon"), Name("Red"), 9, 8, 6)
+        self.assertEqual(creature.species, "Dragon")
+        self.assertEqual(creature.color, "Red")
+
+    def test_creature_has_no_instance_dict(self):
+        creature = Creature("Ember", "Dragon", "Red", 9, 8, 6)
+        self.assertFalse(hasattr(creature, "__dict__"))
+        with self.assertRaises(AttributeError):
+            creature.nickname = "Em"
+
+    def test_str_lists_stats_and_parents(self):
+        parent1, parent2 = make_dragons()
+        offspring = Creature("Emost", "Dragon", "Purple", 8, 8, 7, 2, (parent1, parent2))
+        self.assertEqual(str(parent1), "\n".join([
+            "Creature: Ember",
+            "  Species: Dragon",
+            "  Color: Red",
+            "  Size: 9/10",
+            "  Strength: 8/10",
+            "  Intelligence: 6/10",
+            "  Generation: 1",
+        ]))
+        self.assertEqual(str(offspring).splitlines()[-1], "  Parents: Ember & Frost")
+
+    def test_traits_are_clamped(self):
+        creature = Creature("Odd", "Dragon", "Red", -3, 15, 7)
+        self.assertEqual((creature.size, creature.strength, creature.intelligence), (1, 10, 7))
+
+    def test_inherited_traits_are_clamped(self):
+        self.assertEqual(_inherit_trait(10, 10, fixed_draws(0.99)), 10)
+        self.assertEqual(_inherit_trait(1, 1, fixed_draws(0.0)), 1)
+
+    def test_get_stats_returns_stats_tuple(self):
+        creature = Creature("Ember", "Dragon", "Red", 9, 8, 6)
+        stats = creature.get_stats()
+        self.assertEqual(stats, Stats("Ember", "Dragon", "Red", 9, 8, 6, 1))
+        self.assertEqual(stats.strength, 8)
+        self.assertEqual(stats._asdict()["intelligence"], 6)
+
+
+class BreedingRNGTest(unittest.TestCase):
+
+    def test_draws_are_in_unit_interval(self):
+        rng_buf = BreedingRNG(1000, seed=1)
+        self.assertEqual(len(rng_buf.draws), 1000 * BreedingRNG.DRAWS_PER_OFFSPRING)
+        self.assertTrue(all(0 <= value < 1 for value in rng_buf.draws))
+
+    def test_exhausted_buffer_raises(self):
+        parent1, parent2 = make_dragons()
+        rng_buf = BreedingRNG(1, seed=1)
+        breed_creatures(parent1, parent2, rng_buf)
+        with self.assertRaises(IndexError):
+            breed_creatures(parent1, parent2, rng_buf)
+
+    def test_take_more_than_remaining_raises(self):
+        rng_buf = BreedingRNG(2, seed=1)
+        with self.assertRaises(IndexError):
+            rng_buf.take(3)
+        self.assertEqual(rng_buf.i, 0)
+
+    def test_seeded_breed_batch_gives_same_offspring(self):
+        def breed(seed):
+            population = Population(make_dragons())
+            rows = population.breed_batch([0, 1, 0], [1, 0, 1], BreedingRNG(3, seed=seed))
+            return [population.creature(row).get_stats() for row in rows]
+
+        self.assertEqual(breed(7), breed(7))
+
+
+class PopulationTest(unittest.TestCase):
+
+    def assertColumnsHaveLength(self, population, length):
+        lengths = {len(population.names), len(population.species), len(population.colors),
+                   len(population.generations), len(population.parents), len(population._views)}
+        lengths.update(len(column) for column in population.traits)
+        self.assertEqual(lengths, {length})
+
+    def test_breed_batch_appends_offspring_rows(self):
+        population = Population(make_dragons())
+        rows = population.breed_batch([0, 1], [1, 0])
+        self.assertEqual(rows, [2, 3])
+        self.assertEqual(len(population), 4)
+        offspring = population.creature(2)
+        self.assertEqual(offspring.species, "Dragon")
+        self.assertEqual(offspring.generation, 2)
+        self.assertEqual([parent.name for parent in offspring.parents], ["Ember", "Frost"])
+
+    def test_breed_batch_traits_stay_in_range(self):
+        population = Population([Creature("Low", "Dragon", "Red", 1, 1, 1),
+                                 Creature("High", "Dragon", "Blue", 10, 10, 10)])
+        rows = population.breed_batch([0] * 200 + [1] * 200, [0] * 200 + [1] * 200)
+        for column in population.traits:
+            for row in rows:
+                self.assertTrue(1 <= column[row] <= 10)
+
+    def test_breed_batch_of_no_pairs_is_empty(self):
+        population = Population(make_dragons())
+        self.assertEqual(population.breed_batch([], []), [])
+        self.assertColumnsHaveLength(population, 2)
+
+    def test_breed_batch_species_mismatch_raises(self):
+        dragon, _ = make_dragons()
+        unicorn = Creature("Sparkle", "Unicorn", "White", 7, 5, 9)
+        population = Population([dragon, unicorn])
+        with self.assertRaises(ValueError):
+            population.breed_batch([0], [1])
+        self.assertColumnsHaveLength(population, 2)
+
+    def test_breed_batch_rejects_out_of_range_indices(self):
+        population = Population(make_dragons())
+        for parents1_idx, parents2_idx in (([-1], [0]), ([0], [2]), ([0], [-3])):
+            with self.assertRaises(ValueError):
+                population.breed_batch(parents1_idx, parents2_idx)
+        self.assertColumnsHaveLength(population, 2)
+
+    def test_breed_batch_rejects_mismatched_lengths(self):
+        population = Population(make_dragons())
+        with self.assertRaises(ValueError):
+            population.breed_batch([0, 1], [1])
+
+    def test_add_rejects_out_of_range_trait_without_partial_row(self):
+        population = Population(make_dragons())
+        creature = Creature("Bad", "Dragon", "Red", 5, 5, 5)
+        creature.size = 300
+        with self.assertRaises(ValueError):
+            population.add(creature)
+        self.assertColumnsHaveLength(population, 2)
+
+    def test_add_rejects_float_trait_without_partial_row(self):
+        population = Population(make_dragons())
+        with self.assertRaises(TypeError):
+            population.add(Creature("Alpha", "Dragon", "Red", 5.5, 5, 5))
+        self.assertColumnsHaveLength(population, 2)
+
+    def test_add_accepts_large_generation(self):
+        population = Population()
+        population.add(Creature("Old", "Dragon", "Red", 5, 5, 5, generation=70000))
+        self.assertEqual(population.generations, [70000])
+
+    def test_creature_view_of_deep_pedigree(self):
+        population = Population(make_dragons())
+        row1, row2 = 0, 1
+        for _ in range(1200):
+            row1, row2 = population.breed_batch([row1], [row2])[0], row1
+        self.assertEqual(population.creature(row1).generation, 1201)
+
+
+class OffspringNameTest(unittest.TestCase):
+
+    def test_long_names_are_blended(self):
+        self.assertEqual(_generate_offspring_name("Ember", "Frost"), "Emost")
+        self.assertEqual(_generate_offspring_name("Thunder", "Storm"), "Thuorm")
+
+    def test_short_names_get_suffix(self):
+        self.assertEqual(_generate_offspring_name("Al", "Bo"), "AlBoJr")
+        self.assertEqual(_generate_offspring_name("Ember", "Bo"), "EmberBoJr")
+
+    def test_repeated_pair_gives_same_name(self):
+        self.assertEqual(_generate_offspring_name("Blaze", "Solar"),
+                         _generate_offspring_name("Blaze", "Solar"))
+
+
+class InheritColorTest(unittest.TestCase):
+
+    def test_blend_ignores_parent_order(self):
+        for color1, color2, blend in (("Red", "Blue", "Purple"),
+                                      ("Red", "Yellow", "Orange"),
+                                      ("Blue", "Yellow", "Green")):
+            self.assertEqual(_inherit_color(color1, color2, fixed_draws(0.1, 0.9)), blend)
+            self.assertEqual(_inherit_color(color2, color1, fixed_draws(0.1, 0.9)), blend)
+
+    def test_no_blend_inherits_from_a_parent(self):
+        self.assertEqual(_inherit_color("Red", "Blue", fixed_draws(0.5, 0.1)), "Red")
+        self.assertEqual(_inherit_color("Red", "Blue", fixed_draws(0.5, 0.9)), "Blue")
+
+    def test_unblendable_pair_never_blends(self):
+        self.assertEqual(_inherit_color("Gold", "Silver", fixed_draws(0.0, 0.1)), "Gold")
+        self.assertEqual(_inherit_color("Red", "Red", fixed_draws(0.0, 0.9)), "Red")
+
+
+class TraitTableTest(unittest.TestCase):
+
+    def expected_distribution(self, total):
+        """Returns the analytic _inherit_trait() distribution for a parent trait sum."""
+        half = total // 2
+        if total % 2:
+            # Average ends in .5: the mutation rounds down or up with equal odds
+            outcomes = {half: Fraction(1, 2), half + 1: Fraction(1, 2)}
+        else:
+            # Whole average: a mutation below -0.5 or above 0.5 moves it by one
+            outcomes = {half - 1: Fraction(1, 4), half: Fraction(1, 2), half + 1: Fraction(1, 4)}
+        clamped = Counter()
+        for value, probability in outcomes.items():
+            clamped[min(10, max(1, value))] += probability
+        return dict(clamped)
+
+    def test_table_matches_inherit_trait_distribution(self):
+        table = _trait_table()
+        for total in range(2, 21):
+            counts = Counter(table[total])
+            observed = {value: Fraction(count, 256) for value, count in counts.items()}
+            self.assertEqual(observed, self.expected_distribution(total), total)
+
+
+class DisplayFamilyTreeTest(unittest.TestCase):
+
+    def render(self, creature, indent=0):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            display_family_tree(creature, indent)
+        return output.getvalue().splitlines()
+
+    def test_diamond_pedigree_expands_shared_ancestor_once(self):
+        blaze = Creature("Blaze", "Phoenix", "Red", 7, 6, 9)
+        solar = Creature("Solar", "Phoenix", "Yellow", 6, 5, 9)
+        pyra = Creature("Pyra", "Phoenix", "Red", 8, 7, 8)
+        left = Creature("Left", "Phoenix", "Red", 7, 6, 9, 2, (blaze, solar))
+        right = Creature("Right", "Phoenix", "Red", 7, 6, 8, 2, (solar, pyra))
+        child = Creature("Child", "Phoenix", "Red", 7, 6, 9, 3, (left, right))
+
+        self.assertEqual(self.render(child), [
+            "Child (Gen 3, Phoenix)",
+            "├─ Parents:",
+            "  Left (Gen 2, Phoenix)",
+            "  ├─ Parents:",
+            "    Blaze (Gen 1, Phoenix)",
+            "    Solar (Gen 1, Phoenix)",
+            "  Right (Gen 2, Phoenix)",
+            "  ├─ Parents:",
+            "    Solar (Gen 1, Phoenix) [see above]",
+            "    Pyra (Gen 1, Phoenix)",
+        ])
+
+    def test_negative_indent_is_not_indented(self):
+        parent1, parent2 = make_dragons()
+        offspring = breed_creatures(parent1, parent2)
+        self.render(offspring, 5)
+        lines = self.render(offspring, -1)
+        self.assertEqual(lines[0], f"{offspring.name} (Gen 2, Dragon)")
+        self.assertEqual(lines[2], "Ember (Gen 1, Dragon)")
+
+    def test_deep_pedigree_does_not_hit_recursion_limit(self):
+        parent1, parent2 = make_dragons()
+        for _ in range(3000):
+            parent1, parent2 = breed_creatures(parent1, parent2), parent1
+        lines = self.render(parent1)
+        self.assertEqual(lines[0], f"{parent1.name} (Gen 3001, Dragon)")
+
+
+if __name__ == "__main__":
+    unittest.main()